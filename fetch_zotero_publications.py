@@ -11,6 +11,7 @@ Environment Variables (recommended for security):
     ZOTERO_GROUP_ID - Your Zotero group ID
     ZOTERO_COLLECTION_KEY - Your collection key
     OUTPUT_DIR - Directory to save output files (default: current directory)
+    ZOTERO_CACHE_DIR - Directory for the response cache (default: .zotero_cache)
 
 For GitHub Actions, set these as repository secrets.
 """
@@ -22,8 +23,12 @@ import re
 import sys
 import time
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Optional
+from itertools import chain, islice
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
 
 try:
     import requests
@@ -37,6 +42,16 @@ except ImportError:
     print("ERROR: pyyaml library not installed. Run: pip install pyyaml")
     sys.exit(1)
 
+# Optional: orjson decodes API responses faster than the stdlib parser
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Use the libyaml C emitter when PyYAML was built with it
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 # =============================================================================
 # Configuration
@@ -53,152 +68,469 @@ def get_config():
     }
 
 
+# =============================================================================
+# Region Keywords
+# =============================================================================
+
+# Region -> title keywords. Edit this table to customize classification.
+# Checked in order; the first region whose keywords appear in the title wins.
+# Keywords are matched as lowercase substrings, so list them in lowercase.
+REGION_KEYWORDS = [
+    # Hawaiian Archipelago keywords
+    ('Hawaiian Archipelago', ('hawai', 'kahekili', 'maui', 'ahu', 'northwestern',
+                              'papahānaumokuākea', 'kauai', 'oahu', 'big island')),
+    # American Samoa keywords
+    ('American Samoa', ('samoa', 'aua', 'swains')),
+    # Mariana Archipelago keywords
+    ('Mariana Archipelago', ('guam', 'mariana', 'saipan', 'tinian', 'rota')),
+    # Pacific Remote Island Areas (PRIA)
+    ('Pacific Remote Island Areas', ('wake', 'baker', 'howland', 'jarvis', 'palmyra',
+                                     'kingman', 'johnston')),
+    # Pacific-wide (catch-all for broad Pacific studies)
+    ('Pacific-wide', ('pacific',)),
+]
+
+# Keyword -> index into REGION_KEYWORDS (lower index = higher priority)
+_KEYWORD_RANK = {
+    keyword: rank
+    for rank, (_, keywords) in enumerate(REGION_KEYWORDS)
+    for keyword in keywords
+}
+
+# One alternation over every keyword, listed in priority order, so a single
+# scan finds the leftmost keyword of any region
+_ANY_REGION_RE = re.compile("|".join(map(re.escape, _KEYWORD_RANK)))
+
+# Per-region patterns, only used to look for a higher-priority region later
+# in the title than the first keyword found
+_REGION_PATTERNS = [
+    re.compile("|".join(map(re.escape, keywords)))
+    for _, keywords in REGION_KEYWORDS
+]
+
+
+# Zotero item types that are never publications in their own right
+_SKIP_ITEM_TYPES = frozenset({"attachment", "note", "annotation"})
+
+# Query parameters shared by every item request. Attachments are excluded
+# server-side; notes and annotations are still filtered out in process_publications
+_ITEM_QUERY = {"format": "json", "include": "data", "itemType": "-attachment"}
+
+
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
+_YEAR_RE = re.compile(r"\b(\d{4})\b")
+
+
 def extract_year(date_str: Optional[str]) -> Optional[int]:
     """Extract 4-digit year from date string."""
     if not date_str:
         return None
-    match = re.search(r"\b\d{4}\b", str(date_str))
-    return int(match.group(0)) if match else None
+    if not isinstance(date_str, str):
+        date_str = str(date_str)
+    match = _YEAR_RE.search(date_str)
+    return int(match.group(1)) if match else None
 
 
-def assign_region(title: str) -> str:
-    """Assign region based on publication title keywords."""
+def assign_region(title: str, title_lower: Optional[str] = None) -> str:
+    """
+    Assign region based on publication title keywords.
+    
+    Pass title_lower when the caller already has the lowercased title.
+    """
     if not title:
         return 'Unknown'
     
-    title_lower = title.lower()
-    
-    # Hawaiian Archipelago keywords
-    if any(area in title_lower for area in ['hawai', 'hawaii', 'kahekili', 'maui', 'ahu', 
-                                              'northwestern', 'papahānaumokuākea', 'kauai', 'oahu', 'big island']):
-        return 'Hawaiian Archipelago'
-    
-    # American Samoa keywords
-    elif any(area in title_lower for area in ['samoa', 'aua', 'swains', 'american samoa']):
-        return 'American Samoa'
-    
-    # Mariana Archipelago keywords
-    elif any(area in title_lower for area in ['guam', 'mariana', 'saipan', 'tinian', 'rota']):
-        return 'Mariana Archipelago'
-    
-    # Pacific Remote Island Areas (PRIA)
-    elif any(area in title_lower for area in ['wake', 'baker', 'howland', 'jarvis', 'palmyra', 
-                                               'kingman', 'johnston', 'jarvisisland']):
-        return 'Pacific Remote Island Areas'
+    if title_lower is None:
+        title_lower = title.lower()
+    match = _ANY_REGION_RE.search(title_lower)
+    if match is None:
+        return 'Unknown'
     
-    # Pacific-wide (catch-all for broad Pacific studies)
-    elif 'pacific' in title_lower:
-        return 'Pacific-wide'
+    rank = _KEYWORD_RANK[match.group()]
+    for better in range(rank):
+        if _REGION_PATTERNS[better].search(title_lower, match.start()):
+            return REGION_KEYWORDS[better][0]
     
-    else:
-        return 'Unknown'
+    return REGION_KEYWORDS[rank][0]
+
+
+def format_creator(creator: Dict) -> str:
+    """Format one creator; institutional creators use a single 'name' field."""
+    name = (creator.get('name') or '').strip()
+    if name:
+        return name
+    first = (creator.get('firstName') or '').strip()
+    last = (creator.get('lastName') or '').strip()
+    return f"{first} {last}".strip()
 
 
 def clean_creators(creators: List[Dict]) -> str:
     """Format creator names from API response."""
     if not creators:
         return ""
-    names = []
-    for creator in creators:
-        first = creator.get('firstName', '').strip()
-        last = creator.get('lastName', '').strip()
-        if first or last:
-            names.append(f"{first} {last}".strip())
-    return "; ".join(names)
+    return "; ".join(filter(None, map(format_creator, creators)))
+
+
+# =============================================================================
+# Cache Functions
+# =============================================================================
+
+def read_cache_version(cache_dir: str, base_url: str) -> Optional[int]:
+    """Return the library version of the cached items for base_url, if any."""
+    try:
+        with open(Path(cache_dir) / "version.json", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # A cache made for another endpoint or query cannot answer this request
+    if meta.get("url") != base_url or meta.get("query") != _ITEM_QUERY:
+        return None
+    return meta.get("version")
+
+
+def read_cached_items(cache_dir: str) -> Optional[List[Dict]]:
+    """Load cached API items, or None if the cache file is missing or corrupt."""
+    try:
+        with open(Path(cache_dir) / "items.jsonl", encoding="utf-8") as f:
+            return [_json_loads(line) for line in f]
+    except (OSError, ValueError):
+        return None
+
+
+def open_cache(cache_dir: str) -> TextIO:
+    """
+    Start a new items cache file (one JSON object per line).
+    
+    The previous cached version is invalidated immediately, so a partial
+    write is never treated as current.
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    (cache_dir / "version.json").unlink(missing_ok=True)
+    return open(cache_dir / "items.tmp", "w", encoding="utf-8")
+
+
+def close_cache(cache_file: TextIO, cache_dir: str, base_url: str, version: Optional[int]):
+    """
+    Finish a cache file started with open_cache: commit it as the cached
+    items for the given library version, or discard it if version is None.
+    """
+    cache_file.close()
+    cache_dir = Path(cache_dir)
+    tmp_file = cache_dir / "items.tmp"
+    
+    if version is None:
+        tmp_file.unlink(missing_ok=True)
+        return
+    
+    os.replace(tmp_file, cache_dir / "items.jsonl")
+    with open(cache_dir / "version.json", "w", encoding="utf-8") as f:
+        json.dump({"url": base_url, "query": _ITEM_QUERY, "version": version}, f)
+    print(f"✓ Cached items at library version {version}")
 
 
 # =============================================================================
 # API Functions
 # =============================================================================
 
-def fetch_all_items(base_url: str, headers: Dict, batch_size: int = 100) -> List[Dict]:
+class RateLimiter:
+    """
+    Spaces out request starts across worker threads and honors server
+    Backoff/Retry-After pauses for every worker at once.
+    
+    The spacing adapts (additive-increase, multiplicative-decrease style):
+    each successful response shortens it by 10%, and each rate-limit
+    signal doubles it, within [min_interval, max_interval].
+    """
+    
+    def __init__(self, interval: float = 0.1, min_interval: float = 0.05,
+                 max_interval: float = 5.0):
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        """Block until this caller may send its next request."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+    
+    def record_success(self):
+        """Speed up after a response that carried no rate-limit signal."""
+        with self._lock:
+            self.interval = max(self.min_interval, self.interval * 0.9)
+    
+    def record_backoff(self, seconds: Optional[float] = None):
+        """
+        Slow down after a rate-limit signal and hold back all new requests
+        for the server-requested seconds (or the new interval if none given).
+        """
+        with self._lock:
+            self.interval = min(self.max_interval, self.interval * 2.0)
+            pause = self.interval if seconds is None else seconds
+            self._next_start = max(self._next_start, time.monotonic() + pause)
+            interval = self.interval
+        print(f"⏳ Rate limited. Pausing requests for {pause:g} seconds "
+              f"(request delay now {interval:.2f}s)...")
+
+
+def parse_header_int(value: Optional[str]) -> Optional[int]:
+    """
+    Parse a non-negative integer header value (e.g. Total-Results);
+    returns None if the header is missing or malformed.
+    """
+    if value is None:
+        return None
+    try:
+        number = int(value)
+    except ValueError:
+        return None
+    return number if number >= 0 else None
+
+
+def parse_wait_seconds(value: str) -> Optional[float]:
     """
-    Fetch all items from Zotero API with pagination support.
+    Parse a Backoff/Retry-After value in seconds; returns None for other
+    forms (e.g. an HTTP-date) so the limiter falls back to its own delay.
+    """
+    try:
+        seconds = float(value)
+    except ValueError:
+        return None
+    return seconds if 0 <= seconds < float("inf") else None
+
+
+def fetch_page(session: requests.Session, base_url: str, start: int, batch_size: int,
+               limiter: RateLimiter, max_retries: int = 3,
+               headers: Optional[Dict] = None) -> Optional[Tuple[requests.Response, List[Dict]]]:
+    """
+    Fetch and decode a single page of items, retrying on request errors
+    and on bodies that are not valid JSON.
     
     Args:
+        session: Shared HTTP session (carries the API key headers)
         base_url: Zotero API endpoint URL
-        headers: Request headers with API key
+        start: Offset of the first item on the page
         batch_size: Items per request (max 100)
+        limiter: Adaptive rate limiter shared by all workers
+        max_retries: Attempts before giving up on the page
+        headers: Extra headers for this request only
     
     Returns:
-        List of all items from the collection
+        (response, items) for a successful page (items is empty for a
+        304 Not Modified), or None if every attempt failed
     """
-    all_items = []
-    start = 0
-    max_retries = 3
-    retry_count = 0
+    params = {**_ITEM_QUERY, "limit": batch_size, "start": start}
     
-    while True:
-        params = {"format": "json", "limit": batch_size, "start": start}
-        print(f"📥 Fetching items {start} to {start + batch_size}...")
+    for attempt in range(1, max_retries + 1):
+        limiter.wait()
+        print(f"📥 Fetching items {start} to {start + batch_size} "
+              f"(request delay {limiter.interval:.2f}s)...")
         
         try:
-            response = requests.get(base_url, headers=headers, params=params, timeout=15)
-            response.raise_for_status()
-            items = response.json()
-            
-            if not items:  # No more items
-                print("✓ All items fetched")
-                break
+            response = session.get(base_url, params=params, headers=headers, timeout=15)
             
-            all_items.extend(items)
-            start += batch_size
-            retry_count = 0  # Reset retry counter on success
+            # Respect rate limits (Backoff on success, Retry-After on 429/503)
+            wait_header = response.headers.get('Backoff') or response.headers.get('Retry-After')
+            if wait_header:
+                limiter.record_backoff(parse_wait_seconds(wait_header))
+            elif response.status_code == 429:
+                limiter.record_backoff()
+            elif response.ok:
+                limiter.record_success()
             
-            # Respect rate limits
-            if 'Backoff' in response.headers:
-                backoff_seconds = int(response.headers['Backoff'])
-                print(f"⏳ Rate limited. Waiting {backoff_seconds} seconds...")
-                time.sleep(backoff_seconds)
+            response.raise_for_status()
+            if response.status_code == 304:
+                return response, []
+            # Decode here so a truncated or non-JSON body is retried too
+            items = _json_loads(response.content)
+            if not isinstance(items, list):
+                raise ValueError(f"expected a JSON list of items, got {type(items).__name__}")
+            return response, items
+        
+        except (requests.exceptions.RequestException, ValueError) as e:
+            if attempt >= max_retries:
+                print(f"❌ Error fetching items {start}+ (max retries exceeded): {e}")
+                return None
+            print(f"⚠️ Error fetching data: {e}. Retrying ({attempt}/{max_retries})...")
+            time.sleep(2 ** attempt)  # Exponential backoff
+    
+    return None
+
+
+def iter_pages_sequentially(session: requests.Session, base_url: str, batch_size: int,
+                            limiter: RateLimiter) -> Iterator[Optional[Tuple[requests.Response, List[Dict]]]]:
+    """
+    Yield pages after the first one by one until an empty page, for when
+    the total item count is unknown. Stops after a page that failed.
+    """
+    start = batch_size
+    while True:
+        page = fetch_page(session, base_url, start, batch_size, limiter)
+        yield page
+        if page is None or not page[1]:
+            return
+        start += batch_size
+
+
+def iter_items(base_url: str, headers: Dict, batch_size: int = 100,
+               max_workers: int = 5, cache_dir: Optional[str] = None) -> Iterator[Dict]:
+    """
+    Yield all items from Zotero API with pagination support.
+    
+    The first page is fetched on its own to read the Total-Results header;
+    the remaining pages are then requested concurrently over one session
+    (or one at a time until an empty page if the header is missing).
+    Items are yielded page by page in collection order as pages arrive, so
+    callers can process them while later pages are still downloading.
+    
+    With a cache_dir, the first request carries If-Modified-Since-Version
+    from the last complete fetch; if the library is unchanged the cached
+    items are yielded without downloading any pages.
+    
+    Args:
+        base_url: Zotero API endpoint URL
+        headers: Request headers with API key
+        batch_size: Items per request (max 100)
+        max_workers: Concurrent page requests
+        cache_dir: Directory for the response cache (None disables caching)
+    
+    Yields:
+        Items from the collection
+    """
+    limiter = RateLimiter()
+    cached_version = read_cache_version(cache_dir, base_url) if cache_dir else None
+    
+    with requests.Session() as session:
+        session.headers.update(headers)
+        
+        conditional = None
+        if cached_version is not None:
+            conditional = {"If-Modified-Since-Version": str(cached_version)}
+        first = fetch_page(session, base_url, 0, batch_size, limiter, headers=conditional)
+        
+        if first is not None and first[0].status_code == 304:
+            cached_items = read_cached_items(cache_dir)
+            if cached_items is not None:
+                print(f"✓ Library unchanged since version {cached_version}; using cached items")
+                yield from cached_items
+                return
+            # Cache is unreadable; fall back to a full fetch
+            first = fetch_page(session, base_url, 0, batch_size, limiter)
+        
+        if first is None:
+            return
+        first_response = first[0]
+        total_results = parse_header_int(first_response.headers.get('Total-Results'))
+        version = first_response.headers.get('Last-Modified-Version')
+        cache_version = parse_header_int(version)  # None disables caching this fetch
+        
+        cache_file = open_cache(cache_dir) if cache_dir and cache_version is not None else None
+        consistent = True
+        complete = False
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            if total_results is not None:
+                # map() yields pages in offset order, keeping the original item order
+                rest = executor.map(
+                    lambda start: fetch_page(session, base_url, start, batch_size, limiter),
+                    range(batch_size, total_results, batch_size),
+                )
+            elif len(first[1]) < batch_size:
+                rest = []  # the first page was also the last
             else:
-                time.sleep(0.5)  # Be nice to the API
-                
-        except requests.exceptions.RequestException as e:
-            retry_count += 1
-            if retry_count >= max_retries:
-                print(f"❌ Error fetching data (max retries exceeded): {e}")
-                break
-            print(f"⚠️ Error fetching data: {e}. Retrying ({retry_count}/{max_retries})...")
-            time.sleep(2 ** retry_count)  # Exponential backoff
+                print("⚠️ Total-Results header missing or invalid; fetching remaining pages one at a time")
+                rest = iter_pages_sequentially(session, base_url, batch_size, limiter)
+            
+            for page in chain([first], rest):
+                if page is None:
+                    consistent = False
+                    continue
+                response, items = page
+                # A different version means the library changed mid-fetch
+                if response.headers.get('Last-Modified-Version') != version:
+                    consistent = False
+                for item in items:
+                    if cache_file is not None:
+                        cache_file.write(json.dumps(item, ensure_ascii=False))
+                        cache_file.write("\n")
+                    yield item
+            complete = True
+        finally:
+            # Drop queued page requests if the caller stopped reading early
+            executor.shutdown(wait=True, cancel_futures=True)
+            # Only cache a consistent, complete snapshot
+            if cache_file is not None:
+                close_cache(cache_file, cache_dir, base_url,
+                            cache_version if complete and consistent else None)
+    
+    print("✓ All items fetched")
+
+
+def fetch_all_items(base_url: str, headers: Dict, batch_size: int = 100,
+                    max_workers: int = 5, cache_dir: Optional[str] = None) -> List[Dict]:
+    """
+    Fetch all items from Zotero API into a list (see iter_items).
     
-    return all_items
+    Returns:
+        List of all items from the collection
+    """
+    return list(iter_items(base_url, headers, batch_size, max_workers, cache_dir))
 
 
 # =============================================================================
 # Processing Functions
 # =============================================================================
 
-def process_publications(all_items: List[Dict]) -> List[Dict]:
+def process_publications(all_items: Iterable[Dict]) -> List[Dict]:
     """
     Process and filter publications from API response.
     
+    Items are consumed in a single pass, so all_items may be a lazy
+    iterator such as iter_items().
+    
     Args:
         all_items: Raw items from Zotero API
     
     Returns:
         Cleaned and filtered publications list
     """
-    filtered_publications = []
-    duplicate_checker = set()
+    rows = []  # (sort key, publication) pairs
+    duplicate_checker = set()  # hashes of normalized titles
+    received = 0
     errors = 0
+    skipped = 0
     
     for entry in all_items:
+        received += 1
         try:
             data = entry.get("data", {})
             
+            # Skip attachments, notes, etc. before any field processing
+            if data.get("itemType") in _SKIP_ITEM_TYPES:
+                skipped += 1
+                continue
+            
             # Extract fields
             title = data.get("title", "").strip()
             if not title:
                 continue  # Skip entries without title
             
-            # Check for duplicates (by title)
-            if title in duplicate_checker:
+            # Check for duplicates (by title, ignoring case and whitespace)
+            title_lower = title.lower()  # shared by dedup and region lookup
+            normalized_title = " ".join(title_lower.split())
+            title_key = hash(normalized_title)
+            if title_key in duplicate_checker:
                 continue
-            duplicate_checker.add(title)
+            duplicate_checker.add(title_key)
             
             # Build publication record
             pub = {
@@ -208,13 +540,14 @@ def process_publications(all_items: List[Dict]) -> List[Dict]:
                 "doi": data.get("DOI", "").strip() or None,
                 "issn": data.get("ISSN", "").strip() or None,
                 "url": data.get("url", "").strip() or None,
-                "region": assign_region(title),
+                "region": assign_region(title, title_lower),
                 # Additional useful fields
                 "item_type": data.get("itemType", ""),
                 "publication_title": data.get("publicationTitle", "").strip() or None,
             }
             
-            filtered_publications.append(pub)
+            # Sort key is the negated year so an ascending sort puts newest first
+            rows.append((-(pub["year"] or 0), pub))
         
         except Exception as e:
             print(f"⚠️ Error processing entry: {e}")
@@ -222,12 +555,15 @@ def process_publications(all_items: List[Dict]) -> List[Dict]:
             continue
     
     # Sort by year (descending)
-    filtered_publications.sort(key=lambda x: x["year"] or 0, reverse=True)
+    rows.sort(key=itemgetter(0))
+    filtered_publications = [pub for _, pub in rows]
     
     print(f"\n📊 Processing Results:")
+    print(f"  📥 Items received: {received}")
     print(f"  ✓ Successfully processed: {len(filtered_publications)}")
     print(f"  ✗ Errors encountered: {errors}")
-    print(f"  🔄 Duplicates removed: {len(all_items) - len(filtered_publications) - errors}")
+    print(f"  ⏭️ Non-publication items skipped: {skipped}")
+    print(f"  🔄 Duplicates removed: {received - len(filtered_publications) - errors - skipped}")
     
     # Print region distribution
     print(f"\n📍 Region Distribution:")
@@ -265,9 +601,14 @@ def export_publications(filtered_publications: List[Dict], output_dir: str) -> D
     csv_file = output_dir / "filtered_pifsc_publications.csv"
     with open(csv_file, "w", newline="", encoding="utf-8") as f:
         if filtered_publications:
-            writer = csv.DictWriter(f, fieldnames=filtered_publications[0].keys())
-            writer.writeheader()
-            writer.writerows(filtered_publications)
+            # Columns follow the record built in process_publications()
+            fieldnames = list(filtered_publications[0].keys())
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            if len(fieldnames) == 1:
+                writer.writerows([pub[fieldnames[0]]] for pub in filtered_publications)
+            else:
+                writer.writerows(map(itemgetter(*fieldnames), filtered_publications))
     files['csv'] = str(csv_file)
     print(f"✓ CSV export: {csv_file}")
     
@@ -281,7 +622,8 @@ def export_publications(filtered_publications: List[Dict], output_dir: str) -> D
     # Export to YAML (for Jekyll)
     yaml_file = output_dir / "filtered_pifsc_publications.yml"
     with open(yaml_file, "w", encoding="utf-8") as f:
-        yaml.dump(filtered_publications, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        yaml.dump(filtered_publications, f, Dumper=_YAML_DUMPER,
+                  default_flow_style=False, allow_unicode=True, sort_keys=False)
     files['yaml'] = str(yaml_file)
     print(f"✓ YAML export: {yaml_file}")
     
@@ -292,6 +634,17 @@ def export_publications(filtered_publications: List[Dict], output_dir: str) -> D
 # Main Function
 # =============================================================================
 
+def positive_int(value: str) -> int:
+    """argparse type for integer options that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main(args=None):
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -317,6 +670,22 @@ def main(args=None):
         default=os.getenv("ZOTERO_COLLECTION_KEY"),
         help="Zotero collection key"
     )
+    parser.add_argument(
+        "--cache-dir",
+        default=os.getenv("ZOTERO_CACHE_DIR", ".zotero_cache"),
+        help="Directory for the Zotero response cache (default: .zotero_cache)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch every item, ignoring and not updating the cache"
+    )
+    parser.add_argument(
+        "--max-items",
+        type=positive_int,
+        default=None,
+        help="Debug: stop after this many items; disables the cache and skips exporting files"
+    )
     
     parsed_args = parser.parse_args(args)
     
@@ -340,7 +709,6 @@ def main(args=None):
     print("🚀 Zotero Publications Fetcher")
     print("=" * 60)
     
-    base_url = f"https://api.zotero.org/groups/{parsed_args.group_id}/collections/{parsed_args.collection_key}/items"
     headers = {
         "Zotero-API-Key": parsed_args.api_key,
         "Accept": "application/json",
@@ -350,10 +718,15 @@ def main(args=None):
     print(f"  Group ID: {parsed_args.group_id}")
     print(f"  Collection Key: {parsed_args.collection_key}")
     print(f"  Output Directory: {parsed_args.output_dir}")
+    # A truncated debug fetch must not touch the cache of the full collection
+    cache_dir = None if parsed_args.no_cache or parsed_args.max_items else parsed_args.cache_dir
+    print(f"  Cache Directory: {cache_dir or 'disabled'}")
+    if parsed_args.max_items:
+        print(f"  Max Items: {parsed_args.max_items} (debug run: cache disabled, no files exported)")
     print()
     
-    # Fetch
-    print("🔄 Step 1: Fetching Publications")
+    # Fetch and process (items are processed as pages arrive)
+    print("🔄 Step 1: Fetching and Processing Publications")
     print("-" * 60)
     # If no collection key, fetch all items from group; otherwise fetch from specific collection
     if parsed_args.collection_key and parsed_args.collection_key != "VD8Z582Z":
@@ -362,25 +735,26 @@ def main(args=None):
     else:
         base_url = f"https://api.zotero.org/groups/{parsed_args.group_id}/items"
         print("Fetching all items from group...")
-    all_items = fetch_all_items(base_url, headers)
-    print(f"✓ Fetched {len(all_items)} total items\n")
-    
-    if not all_items:
-        print("⚠️ No items retrieved from Zotero")
-        return 1
-    
-    # Process
-    print("🔄 Step 2: Processing Publications")
-    print("-" * 60)
-    filtered_publications = process_publications(all_items)
+    all_items = iter_items(base_url, headers, cache_dir=cache_dir)
+    if parsed_args.max_items:
+        filtered_publications = process_publications(islice(all_items, parsed_args.max_items))
+    else:
+        filtered_publications = process_publications(all_items)
+    all_items.close()  # stops outstanding page requests if --max-items cut the fetch short
     print()
     
     if not filtered_publications:
         print("⚠️ No publications to export")
         return 1
     
+    # Never overwrite the real exports with a truncated debug result
+    if parsed_args.max_items:
+        print(f"⚠️ --max-items set: processed {len(filtered_publications)} publications, "
+              f"skipping export")
+        return 0
+    
     # Export
-    print("🔄 Step 3: Exporting Publications")
+    print("🔄 Step 2: Exporting Publications")
     print("-" * 60)
     files = export_publications(filtered_publications, parsed_args.output_dir)
     print()